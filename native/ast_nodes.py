@@ -1,9 +1,32 @@
 """Clarity AST node definitions."""
 
+from sys import intern
+
+# Every Node subclass, indexed by its integer KIND
+KINDS = []
+
+
+def _make_repr(cls):
+    """Compile a __repr__ specialized to the class's _fields."""
+    fields = ", ".join(f"{f}={{self.{f}!r}}" for f in cls._fields)
+    namespace = {}
+    exec(f"def __repr__(self):\n    return f'{cls.__name__}({fields})'", namespace)
+    return namespace["__repr__"]
+
 
 class Node:
     """Base AST node."""
+    __slots__ = ("line", "column")
     _fields = ()
+    KIND = -1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.KIND = len(KINDS)
+        KINDS.append(cls)
+        cls.__match_args__ = cls._fields
+        if "__repr__" not in cls.__dict__:
+            cls.__repr__ = _make_repr(cls)
 
     def __init__(self, line=None, column=None):
         self.line = line
@@ -17,21 +40,25 @@ class Node:
 # ── Program ──────────────────────────────────────────────
 
 class Program(Node):
+    __slots__ = ("body",)
     _fields = ("body",)
 
     def __init__(self, body):
-        super().__init__()
+        self.line = None
+        self.column = None
         self.body = body
 
 
 # ── Statements ───────────────────────────────────────────
 
 class LetStatement(Node):
+    __slots__ = ("name", "value", "mutable", "type_annotation")
     _fields = ("name", "value", "mutable", "type_annotation")
 
     def __init__(self, name, value, mutable=False, type_annotation=None, line=None, column=None):
-        super().__init__(line, column)
-        self.name = name
+        self.line = line
+        self.column = column
+        self.name = intern(name)
         self.value = value
         self.mutable = mutable
         self.type_annotation = type_annotation  # optional type string
@@ -39,10 +66,12 @@ class LetStatement(Node):
 
 class DestructureLetStatement(Node):
     """let [a, b] = list  OR  let {x, y} = map"""
+    __slots__ = ("targets", "value", "mutable", "kind")
     _fields = ("targets", "value", "mutable", "kind")
 
     def __init__(self, targets, value, mutable=False, kind="list", line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.targets = targets
         self.value = value
         self.mutable = mutable
@@ -50,21 +79,25 @@ class DestructureLetStatement(Node):
 
 
 class AssignStatement(Node):
+    __slots__ = ("target", "operator", "value")
     _fields = ("target", "operator", "value")
 
     def __init__(self, target, operator, value, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.target = target
         self.operator = operator
         self.value = value
 
 
 class FnStatement(Node):
+    __slots__ = ("name", "params", "body", "is_async", "param_types", "return_type")
     _fields = ("name", "params", "body", "is_async", "param_types", "return_type")
 
     def __init__(self, name, params, body, is_async=False, param_types=None, return_type=None, line=None, column=None):
-        super().__init__(line, column)
-        self.name = name
+        self.line = line
+        self.column = column
+        self.name = intern(name)
         self.params = params
         self.body = body
         self.is_async = is_async
@@ -73,18 +106,22 @@ class FnStatement(Node):
 
 
 class ReturnStatement(Node):
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
 
 
 class IfStatement(Node):
+    __slots__ = ("condition", "body", "elif_clauses", "else_body")
     _fields = ("condition", "body", "elif_clauses", "else_body")
 
     def __init__(self, condition, body, elif_clauses=None, else_body=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.condition = condition
         self.body = body
         self.elif_clauses = elif_clauses or []
@@ -92,29 +129,35 @@ class IfStatement(Node):
 
 
 class ForStatement(Node):
+    __slots__ = ("variable", "iterable", "body")
     _fields = ("variable", "iterable", "body")
 
     def __init__(self, variable, iterable, body, line=None, column=None):
-        super().__init__(line, column)
-        self.variable = variable
+        self.line = line
+        self.column = column
+        self.variable = intern(variable)
         self.iterable = iterable
         self.body = body
 
 
 class WhileStatement(Node):
+    __slots__ = ("condition", "body")
     _fields = ("condition", "body")
 
     def __init__(self, condition, body, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.condition = condition
         self.body = body
 
 
 class TryCatch(Node):
+    __slots__ = ("try_body", "catch_var", "catch_body", "finally_body")
     _fields = ("try_body", "catch_var", "catch_body", "finally_body")
 
     def __init__(self, try_body, catch_var, catch_body, finally_body=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.try_body = try_body
         self.catch_var = catch_var
         self.catch_body = catch_body
@@ -122,40 +165,50 @@ class TryCatch(Node):
 
 
 class BreakStatement(Node):
+    __slots__ = ()
     _fields = ()
 
     def __init__(self, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
 
 
 class ContinueStatement(Node):
+    __slots__ = ()
     _fields = ()
 
     def __init__(self, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
 
 
 class ThrowStatement(Node):
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
 
 
 class ShowStatement(Node):
+    __slots__ = ("values",)
     _fields = ("values",)
 
     def __init__(self, values, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.values = values
 
 
 class ImportStatement(Node):
+    __slots__ = ("module", "alias", "names", "path")
     _fields = ("module", "alias", "names", "path")
 
     def __init__(self, module=None, alias=None, names=None, path=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.module = module
         self.alias = alias
         self.names = names
@@ -163,11 +216,13 @@ class ImportStatement(Node):
 
 
 class ClassStatement(Node):
+    __slots__ = ("name", "methods", "parent", "interfaces")
     _fields = ("name", "methods", "parent", "interfaces")
 
     def __init__(self, name, methods, parent=None, interfaces=None, line=None, column=None):
-        super().__init__(line, column)
-        self.name = name
+        self.line = line
+        self.column = column
+        self.name = intern(name)
         self.methods = methods
         self.parent = parent
         self.interfaces = interfaces or []  # list of interface names
@@ -175,19 +230,23 @@ class ClassStatement(Node):
 
 class InterfaceStatement(Node):
     """interface Drawable { fn draw(), fn area() -> number }"""
+    __slots__ = ("name", "method_sigs")
     _fields = ("name", "method_sigs")
 
     def __init__(self, name, method_sigs, line=None, column=None):
-        super().__init__(line, column)
-        self.name = name
+        self.line = line
+        self.column = column
+        self.name = intern(name)
         self.method_sigs = method_sigs  # list of (name, params, return_type)
 
 
 class MatchStatement(Node):
+    __slots__ = ("subject", "arms", "default")
     _fields = ("subject", "arms", "default")
 
     def __init__(self, subject, arms, default=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.subject = subject
         self.arms = arms
         self.default = default
@@ -195,187 +254,229 @@ class MatchStatement(Node):
 
 class MultiAssignStatement(Node):
     """a, b = b, a"""
+    __slots__ = ("targets", "values")
     _fields = ("targets", "values")
 
     def __init__(self, targets, values, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.targets = targets   # list of assignment target expressions
         self.values = values     # list of value expressions
 
 
 class EnumStatement(Node):
     """enum Color { Red, Green, Blue }"""
+    __slots__ = ("name", "members")
     _fields = ("name", "members")
 
     def __init__(self, name, members, line=None, column=None):
-        super().__init__(line, column)
-        self.name = name
+        self.line = line
+        self.column = column
+        self.name = intern(name)
         self.members = members  # list of (name, value_or_None) tuples
 
 
 class DecoratedStatement(Node):
     """@decorator fn ... — wraps a fn or class with decorators."""
+    __slots__ = ("target", "decorators")
     _fields = ("target", "decorators")
 
     def __init__(self, target, decorators, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.target = target        # FnStatement or ClassStatement
         self.decorators = decorators  # list of expressions
 
 
 class ExpressionStatement(Node):
+    __slots__ = ("expression",)
     _fields = ("expression",)
 
     def __init__(self, expression, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.expression = expression
 
 
 class Block(Node):
+    __slots__ = ("statements",)
     _fields = ("statements",)
 
     def __init__(self, statements, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.statements = statements
 
 
 # ── Expressions ──────────────────────────────────────────
 
 class NumberLiteral(Node):
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
 
 
 class StringLiteral(Node):
+    __slots__ = ("value", "raw")
     _fields = ("value",)
 
     def __init__(self, value, line=None, column=None, raw=False):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
         self.raw = raw
 
 
 class BoolLiteral(Node):
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
 
 
 class NullLiteral(Node):
+    __slots__ = ()
     _fields = ()
 
     def __init__(self, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
 
 
 class Identifier(Node):
+    __slots__ = ("name",)
     _fields = ("name",)
 
     def __init__(self, name, line=None, column=None):
-        super().__init__(line, column)
-        self.name = name
+        self.line = line
+        self.column = column
+        self.name = intern(name)
 
 
 class ThisExpression(Node):
+    __slots__ = ()
     _fields = ()
 
     def __init__(self, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
 
 
 class ListLiteral(Node):
+    __slots__ = ("elements",)
     _fields = ("elements",)
 
     def __init__(self, elements, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.elements = elements
 
 
 class MapLiteral(Node):
+    __slots__ = ("pairs",)
     _fields = ("pairs",)
 
     def __init__(self, pairs, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.pairs = pairs
 
 
 class BinaryOp(Node):
+    __slots__ = ("left", "operator", "right")
     _fields = ("left", "operator", "right")
 
     def __init__(self, left, operator, right, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.left = left
         self.operator = operator
         self.right = right
 
 
 class UnaryOp(Node):
+    __slots__ = ("operator", "operand")
     _fields = ("operator", "operand")
 
     def __init__(self, operator, operand, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.operator = operator
         self.operand = operand
 
 
 class CallExpression(Node):
+    __slots__ = ("callee", "arguments")
     _fields = ("callee", "arguments")
 
     def __init__(self, callee, arguments, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.callee = callee
         self.arguments = arguments
 
 
 class MemberExpression(Node):
+    __slots__ = ("object", "property")
     _fields = ("object", "property")
 
     def __init__(self, object, property, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.object = object
-        self.property = property
+        self.property = intern(property)
 
 
 class OptionalMemberExpression(Node):
     """obj?.property"""
+    __slots__ = ("object", "property")
     _fields = ("object", "property")
 
     def __init__(self, object, property, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.object = object
-        self.property = property
+        self.property = intern(property)
 
 
 class IndexExpression(Node):
+    __slots__ = ("object", "index")
     _fields = ("object", "index")
 
     def __init__(self, object, index, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.object = object
         self.index = index
 
 
 class SliceExpression(Node):
     """obj[start..end]"""
+    __slots__ = ("object", "start", "end")
     _fields = ("object", "start", "end")
 
     def __init__(self, object, start=None, end=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.object = object
         self.start = start
         self.end = end
 
 
 class FnExpression(Node):
+    __slots__ = ("params", "body", "param_types", "return_type")
     _fields = ("params", "body", "param_types", "return_type")
 
     def __init__(self, params, body, param_types=None, return_type=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.params = params
         self.body = body
         self.param_types = param_types or {}
@@ -383,54 +484,66 @@ class FnExpression(Node):
 
 
 class PipeExpression(Node):
+    __slots__ = ("value", "function")
     _fields = ("value", "function")
 
     def __init__(self, value, function, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
         self.function = function
 
 
 class RangeExpression(Node):
+    __slots__ = ("start", "end")
     _fields = ("start", "end")
 
     def __init__(self, start, end, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.start = start
         self.end = end
 
 
 class AskExpression(Node):
+    __slots__ = ("prompt",)
     _fields = ("prompt",)
 
     def __init__(self, prompt, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.prompt = prompt
 
 
 class NullCoalesce(Node):
+    __slots__ = ("left", "right")
     _fields = ("left", "right")
 
     def __init__(self, left, right, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.left = left
         self.right = right
 
 
 class SpreadExpression(Node):
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
 
 
 class IfExpression(Node):
     """Inline if used as expression"""
+    __slots__ = ("condition", "true_expr", "false_expr")
     _fields = ("condition", "true_expr", "false_expr")
 
     def __init__(self, condition, true_expr, false_expr, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.condition = condition
         self.true_expr = true_expr
         self.false_expr = false_expr
@@ -438,10 +551,12 @@ class IfExpression(Node):
 
 class ComprehensionExpression(Node):
     """[expr for x in iterable if cond]"""
+    __slots__ = ("expr", "variable", "iterable", "condition")
     _fields = ("expr", "variable", "iterable", "condition")
 
     def __init__(self, expr, variable, iterable, condition=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.expr = expr
         self.variable = variable
         self.iterable = iterable
@@ -450,10 +565,12 @@ class ComprehensionExpression(Node):
 
 class MapComprehensionExpression(Node):
     """{key_expr: val_expr for x in iterable if cond}"""
+    __slots__ = ("key_expr", "value_expr", "variables", "iterable", "condition")
     _fields = ("key_expr", "value_expr", "variables", "iterable", "condition")
 
     def __init__(self, key_expr, value_expr, variables, iterable, condition=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.key_expr = key_expr
         self.value_expr = value_expr
         self.variables = variables  # list of var names (supports k, v destructuring)
@@ -463,17 +580,21 @@ class MapComprehensionExpression(Node):
 
 class AwaitExpression(Node):
     """await expr"""
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
 
 
 class YieldExpression(Node):
     """yield expr"""
+    __slots__ = ("value",)
     _fields = ("value",)
 
     def __init__(self, value=None, line=None, column=None):
-        super().__init__(line, column)
+        self.line = line
+        self.column = column
         self.value = value
@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from lexer import tokenize
 from parser import parse
+from errors import ImportError as ClarityImportError
 import ast_nodes as ast
 
 
@@ -95,6 +96,9 @@ class JSEmitter:
         'WorkerPool', 'Pipeline',
     }
 
+    # Clarity binary operators spelled differently in JS
+    JS_BINARY_OPS = {'and': '&&', 'or': '||'}
+
     def __init__(self, module_name="<main>"):
         self.indent = 0
         self.module_name = module_name
@@ -102,6 +106,7 @@ class JSEmitter:
         self.classes = set(self.KNOWN_CLASSES)  # Seed with all known classes
         self.source_map = []  # (js_line, clarity_file, clarity_line) entries
         self.hoisted_imports = []  # Imports found inside blocks, hoisted to top
+        self.imported_names = {}  # Binding -> source path (hoisting may repeat imports)
 
     def emit(self, program):
         """Emit a full program."""
@@ -122,13 +127,12 @@ class JSEmitter:
     # ── Statements ────────────────────────────────────────
 
     def emit_stmt(self, node):
-        name = node.__class__.__name__
-        method = getattr(self, f'emit_{name}', None)
+        method = self.STMT_DISPATCH[node.KIND]
         if method is None:
-            return f'{self._indent()}/* TODO: {name} */'
-        result = method(node)
+            return f'{self._indent()}/* TODO: {node.__class__.__name__} */'
+        result = method(self, node)
         # Emit source location comment for debuggable stack traces
-        line = getattr(node, 'line', None)
+        line = node.line
         if line is not None:
             result = f'{self._indent()}/*@{self.module_name}:{line}*/\n{result}'
         return result
@@ -241,10 +245,16 @@ class JSEmitter:
             if not js_path.startswith('./') and not js_path.startswith('/'):
                 js_path = './' + js_path
             if node.names:
-                names = ', '.join(self._safe_name(n) for n in node.names)
+                fresh = [safe for safe in (self._safe_name(n) for n in node.names)
+                         if self._claim_import(safe, node)]
+                if not fresh:
+                    return f'{self._indent()}/* already imported: {js_path} */'
+                names = ', '.join(fresh)
                 import_line = f'import {{ {names} }} from "{js_path}";'
             else:
                 alias = self._safe_name(node.alias or node.path.replace('.clarity', ''))
+                if not self._claim_import(alias, node):
+                    return f'{self._indent()}/* already imported: {js_path} */'
                 import_line = f'import * as {alias} from "{js_path}";'
             # JS imports must be at module top level — hoist if nested
             if self.indent > 0:
@@ -256,6 +266,22 @@ class JSEmitter:
             return f'{self._indent()}// module import: {node.module} (provided by runtime)'
         return f'{self._indent()}/* import */'
 
+    def _claim_import(self, binding, node):
+        """Record an import binding; False if this module already imports it.
+
+        Hoisting puts every import in one module scope, so the same name
+        from two different files would silently bind to whichever came first.
+        """
+        seen = self.imported_names.get(binding)
+        if seen is None:
+            self.imported_names[binding] = node.path
+            return True
+        if seen != node.path:
+            raise ClarityImportError(
+                f"'{binding}' is imported from both \"{seen}\" and \"{node.path}\"",
+                node.line, node.column)
+        return False
+
     def emit_ClassStatement(self, node):
         name = self._safe_name(node.name)
         self.classes.add(node.name)
@@ -341,11 +367,10 @@ class JSEmitter:
     def emit_expr(self, node):
         if node is None:
             return 'null'
-        name = node.__class__.__name__
-        method = getattr(self, f'expr_{name}', None)
+        method = self.EXPR_DISPATCH[node.KIND]
         if method is None:
-            return f'/* TODO expr: {name} */'
-        return method(node)
+            return f'/* TODO expr: {node.__class__.__name__} */'
+        return method(self, node)
 
     def expr_NumberLiteral(self, node):
         return str(node.value)
@@ -408,18 +433,9 @@ class JSEmitter:
     def expr_BinaryOp(self, node):
         left = self.emit_expr(node.left)
         right = self.emit_expr(node.right)
-        op = node.operator
-
-        # Map Clarity operators to JS
-        op_map = {
-            'and': '&&', 'or': '||',
-            '**': '**',
-        }
-        js_op = op_map.get(op, op)
-
-        if op == '+':
-            # Clarity: string + anything = string concat (same in JS)
-            return f'({left} + {right})'
+        # Clarity: string + anything = string concat (same in JS), so only
+        # the word operators need translating
+        js_op = self.JS_BINARY_OPS.get(node.operator, node.operator)
         return f'({left} {js_op} {right})'
 
     def expr_UnaryOp(self, node):
@@ -467,6 +483,8 @@ class JSEmitter:
         if len(node.body.statements) == 1 and isinstance(node.body.statements[0], ast.ReturnStatement):
             # Arrow function shorthand
             val = self.emit_expr(node.body.statements[0].value)
+            if val.startswith('{'):
+                val = f'({val})'  # an object literal, not a block body
             return f'(({params}) => {val})'
         # Use arrow functions to preserve lexical `this` binding
         body = self._emit_block_body(node.body)
@@ -624,6 +642,15 @@ class JSEmitter:
         return ''.join(result)
 
 
+def _dispatch_table(prefix):
+    """Handlers named `{prefix}{NodeClass}`, indexed by node KIND."""
+    return [getattr(JSEmitter, f'{prefix}{cls.__name__}', None) for cls in ast.KINDS]
+
+
+JSEmitter.STMT_DISPATCH = _dispatch_table('emit_')
+JSEmitter.EXPR_DISPATCH = _dispatch_table('expr_')
+
+
 # ── Public API ────────────────────────────────────────────
 
 def transpile_source(source, filename="<input>"):
@@ -679,6 +706,7 @@ def main():
     ap.add_argument('file', nargs='?', help='Clarity source file to transpile')
     ap.add_argument('--bundle', action='store_true', help='Bundle CLI + stdlib into single JS')
     ap.add_argument('--compile', action='store_true', help='Compile to native binary via Bun')
+    ap.add_argument('--fresh', action='store_true', help='Re-transpile every file, ignoring up-to-date output')
     ap.add_argument('--out', '-o', help='Output path')
     args = ap.parse_args()
 
@@ -690,14 +718,109 @@ def main():
         print(f'  Transpiled: {args.file} → {out}')
 
     elif args.bundle:
-        bundle(compile_native=args.compile)
+        bundle(compile_native=args.compile, fresh=args.fresh)
 
     else:
         ap.print_help()
 
 
-def bundle(compile_native=False):
-    """Bundle the entire Clarity CLI + stdlib into a single JS program."""
+def _scan_clarity(root):
+    """Map `.clarity` file names in root to their directory entries.
+
+    One scandir pass reuses the OS-supplied entry type instead of a
+    separate stat per candidate file.
+    """
+    found = {}
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name.endswith('.clarity') and entry.is_file():
+                found[entry.name] = entry
+    return found
+
+
+BUNDLE_MANIFEST = '.bundle-manifest.json'
+TRANSPILER_MODULES = ('transpile.py', 'lexer.py', 'parser.py', 'ast_nodes.py', 'tokens.py')
+
+
+def _content_key(path):
+    """Content hash used to decide whether a bundle input changed."""
+    import hashlib
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _load_manifest(path):
+    """Read the bundle manifest, or an empty one if missing or unreadable."""
+    import json
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'transpiler': None, 'files': {}}
+    manifest.setdefault('files', {})
+    return manifest
+
+
+def _save_manifest(path, manifest):
+    import json
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def _write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that."""
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w') as f:
+        f.write(text)
+    return True
+
+
+def _cli_version(stdlib_dir):
+    """Read VERSION out of cli.clarity so the entry point never drifts from it."""
+    prefix = 'let VERSION = "'
+    try:
+        with open(os.path.join(stdlib_dir, 'cli.clarity')) as f:
+            for line in f:
+                if line.startswith(prefix):
+                    return line[len(prefix):].rstrip().rstrip('"')
+    except OSError:
+        pass
+    return None
+
+
+# `--jobs` workers re-run the executable the user started (node or bun
+# plus this script, or a compiled binary) unless CLARITY_BIN overrides it.
+ENTRY_SELF_COMMAND = r'''if (!process.env.CLARITY_BIN) {
+  const q = (s) => "'" + s.replace(/'/g, "'\\''") + "'";
+  const exe = process.execPath;
+  const runtime = /^(node|bun)(\.exe)?$/.test(exe.split(/[\\/]/).pop());
+  process.env.CLARITY_BIN = runtime ? q(exe) + " " + q(process.argv[1]) : q(exe);
+}
+'''
+
+
+def _bundle_one(src):
+    """Transpile one stdlib file for bundle(); returns (js, error)."""
+    try:
+        return transpile_with_runtime(src), None
+    except Exception as e:
+        return None, str(e)
+
+
+def bundle(compile_native=False, fresh=False):
+    """Bundle the entire Clarity CLI + stdlib into a single JS program.
+
+    A manifest in dist/ records a content hash of the source each output
+    was built from; files whose source and transpiler are unchanged are
+    reused, even across fresh checkouts (e.g. a CI-restored dist/).
+    Pass fresh=True to rebuild everything.
+    """
     import subprocess
 
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -728,40 +851,82 @@ def bundle(compile_native=False):
     ]
 
     print('  Transpiling stdlib...')
+    available = _scan_clarity(stdlib_dir)
+    manifest_path = os.path.join(dist_dir, BUNDLE_MANIFEST)
+    manifest = _load_manifest(manifest_path)
+    transpiler_key = '|'.join(
+        _content_key(os.path.join(native_dir, name)) for name in TRANSPILER_MODULES
+    )
+    if fresh or manifest.get('transpiler') != transpiler_key:
+        manifest = {'transpiler': transpiler_key, 'files': {}}
+    built = manifest['files']
+    reused = 0
+    stale = []
     for fname in stdlib_files:
-        src = os.path.join(stdlib_dir, fname)
-        if os.path.exists(src):
-            try:
-                js = transpile_with_runtime(src)
-                out = os.path.join(dist_dir, fname.replace('.clarity', '.js'))
-                with open(out, 'w') as f:
-                    f.write(js)
-                print(f'    {fname} → {os.path.basename(out)}')
-            except Exception as e:
-                print(f'    {fname} — SKIP ({e})')
+        if fname not in available:
+            continue
+        out = os.path.join(dist_dir, fname.replace('.clarity', '.js'))
+        key = _content_key(available[fname].path)
+        if built.get(fname) == key and os.path.exists(out):
+            reused += 1
+            continue
+        stale.append((fname, available[fname].path, out, key))
+
+    # Files are independent, so transpile them across processes
+    sources = [src for _, src, _, _ in stale]
+    if len(sources) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(_bundle_one, sources))
+    else:
+        results = [_bundle_one(src) for src in sources]
+
+    for (fname, src, out, key), (js, err) in zip(stale, results):
+        if err is not None:
+            built.pop(fname, None)
+            print(f'    {fname} — SKIP ({err})')
+            continue
+        _write_if_changed(out, js)
+        built[fname] = key
+        print(f'    {fname} → {os.path.basename(out)}')
+    _save_manifest(manifest_path, manifest)
+    if reused:
+        print(f'    {reused} file(s) up to date')
 
     # Copy runtime
-    import shutil
     runtime_src = os.path.join(native_dir, 'runtime.js')
     runtime_dst = os.path.join(dist_dir, 'runtime.js')
-    shutil.copy2(runtime_src, runtime_dst)
+    with open(runtime_src) as f:
+        _write_if_changed(runtime_dst, f.read())
     print(f'    runtime.js copied')
 
-    # Create entry point
+    # Create entry point. `version` is answered before cli.js (and every
+    # module it imports) is loaded.
     entry = os.path.join(dist_dir, 'clarity-entry.js')
-    with open(entry, 'w') as f:
-        f.write('#!/usr/bin/env bun\n')
-        f.write('// Clarity native entry point\n')
-        f.write('import { clarityMain } from "./runtime.js";\n')
-        f.write('clarityMain(() => {\n')
-        f.write('  import("./cli.js");\n')
-        f.write('});\n')
+    version = _cli_version(stdlib_dir)
+    fast_path = ''
+    if version is not None:
+        fast_path = (
+            'const argv0 = process.argv[2];\n'
+            'if (argv0 === "version" || argv0 === "--version" || argv0 === "-v") {\n'
+            f'  console.log("Clarity v{version}");\n'
+            '  process.exit(0);\n'
+            '}\n'
+        )
+    _write_if_changed(entry, (
+        '#!/usr/bin/env bun\n'
+        '// Clarity native entry point\n'
+        'import { clarityMain } from "./runtime.js";\n'
+        + fast_path + ENTRY_SELF_COMMAND +
+        'clarityMain(() => {\n'
+        '  import("./cli.js");\n'
+        '});\n'
+    ))
     print(f'    clarity-entry.js created')
 
     # Create package.json for the bundle
     pkg_json = os.path.join(dist_dir, 'package.json')
-    with open(pkg_json, 'w') as f:
-        f.write('{"type": "module"}\n')
+    _write_if_changed(pkg_json, '{"type": "module"}\n')
 
     if compile_native:
         print()